@@ -4,12 +4,12 @@ Base agent class that defines the common interface and functionality for all age
 
 import os
 import logging
-import yaml
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Dict, Any, List, Optional
 
 from ..core.message import Message
-from ..core.config import load_config
+from ..core.config import load_config, load_yaml_file
 
 class BaseAgent(ABC):
     """
@@ -34,19 +34,27 @@ class BaseAgent(ABC):
         self.config = load_config(config_path)
         self.agent_config = self.config["agents"].get(agent_type, {})
         
-        # Load agent-specific prompts if they exist
-        self.prompts = {}
-        prompt_path = os.path.join("config", "prompts", f"{agent_type}_prompts.yaml")
-        if os.path.exists(prompt_path):
-            with open(prompt_path, "r") as f:
-                self.prompts = yaml.safe_load(f)
-            self.logger.info(f"Loaded prompts for {agent_type} agent")
-        
         # These will be set when the agent is registered with the event bus
         self.event_bus = None
         self.agent_id = None
         
-        self.logger.info(f"Initialized {agent_type} agent")
+        self.logger.info("Initialized %s agent", agent_type)
+    
+    @cached_property
+    def prompts(self) -> Dict[str, Any]:
+        """
+        Agent-specific prompt templates, loaded on first access.
+        
+        Returns:
+            Dict[str, Any]: Prompts keyed by name, or an empty dict if the agent has none
+        """
+        prompt_path = os.path.join("config", "prompts", f"{self.agent_type}_prompts.yaml")
+        if not os.path.exists(prompt_path):
+            return {}
+        
+        prompts = load_yaml_file(prompt_path) or {}
+        self.logger.info("Loaded prompts for %s agent", self.agent_type)
+        return prompts
     
     def register(self, event_bus, agent_id: str):
         """
@@ -58,14 +66,14 @@ class BaseAgent(ABC):
         """
         self.event_bus = event_bus
         self.agent_id = agent_id
-        self.logger.info(f"Agent {agent_id} registered with event bus")
+        self.logger.info("Agent %s registered with event bus", agent_id)
         
         # Subscribe to relevant event types
         event_types = self.get_subscribed_events()
         for event_type in event_types:
             self.event_bus.subscribe(event_type, self.process_message)
             
-        self.logger.info(f"Subscribed to events: {event_types}")
+        self.logger.info("Subscribed to events: %s", event_types)
     
     def send_message(self, message: Message):
         """
@@ -80,7 +88,7 @@ class BaseAgent(ABC):
             
         message.sender = self.agent_id
         self.event_bus.publish(message)
-        self.logger.debug(f"Sent message of type {message.type}")
+        self.logger.debug("Sent message of type %s", message.type)
     
     def process_message(self, message: Message):
         """
@@ -93,7 +101,7 @@ class BaseAgent(ABC):
             # Don't process our own messages
             return
             
-        self.logger.debug(f"Processing message of type {message.type} from {message.sender}")
+        self.logger.debug("Processing message of type %s from %s", message.type, message.sender)
         
         # Delegate to the handle_message method for agent-specific processing
         self.handle_message(message)
@@ -132,7 +140,7 @@ class BaseAgent(ABC):
             str: The formatted prompt
         """
         if prompt_key not in self.prompts:
-            self.logger.warning(f"Prompt key '{prompt_key}' not found in prompts for {self.agent_type}")
+            self.logger.warning("Prompt key '%s' not found in prompts for %s", prompt_key, self.agent_type)
             return ""
             
         prompt_template = self.prompts[prompt_key]
@@ -140,7 +148,7 @@ class BaseAgent(ABC):
             formatted_prompt = prompt_template.format(**kwargs)
             return formatted_prompt
         except KeyError as e:
-            self.logger.error(f"Error formatting prompt '{prompt_key}': {e}")
+            self.logger.error("Error formatting prompt '%s': %s", prompt_key, e)
             return prompt_template
     
     def log_error(self, error_msg: str, exception: Optional[Exception] = None):
@@ -152,6 +160,6 @@ class BaseAgent(ABC):
             exception (Optional[Exception]): The exception that caused the error
         """
         if exception:
-            self.logger.error(f"{error_msg}: {str(exception)}", exc_info=True)
+            self.logger.error("%s: %s", error_msg, exception, exc_info=True)
         else:
             self.logger.error(error_msg)
@@ -4,21 +4,127 @@ Handles loading and parsing configuration files and environment variables.
 """
 
 import os
+import re
+import copy
+import mmap
 import logging
+import threading
 import yaml
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 
+# Prefer the libyaml-backed C loader/dumper, fall back to pure Python
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+# Prefer orjson for JSON output, fall back to the standard library
+try:
+    import orjson
+    
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
 # Set up logger for this module
 logger = logging.getLogger("core.config")
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Parsed YAML files: path -> (stat key, data). Only the latest version of each
+# file is kept, so editing a file replaces its entry instead of adding one.
+_YAML_CACHE: Dict[str, Tuple[Tuple[str, int, int, int], Any]] = {}
+
+# Merged configs (before env var substitution): custom config path -> (stat keys
+# of the inputs, merged config). Likewise one entry per custom config path.
+_MERGED_CACHE: Dict[Optional[str], Tuple[Tuple, Dict[str, Any]]] = {}
+
+_CACHE_LOCK = threading.Lock()
+
+# Matches a ${VAR} environment variable reference
+_ENV_RE = re.compile(r"\$\{([^}]+)\}")
+
+def _stat_key(path: str) -> Optional[Tuple[str, int, int, int]]:
+    """
+    Build a cache key identifying the current on-disk version of a file.
+    
+    Args:
+        path (str): Path to the file
+        
+    Returns:
+        Optional[Tuple[str, int, int, int]]: (path, mtime_ns, size, inode), or None if missing
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size, st.st_ino)
+
+def load_yaml_file(path: str) -> Any:
+    """
+    Parse a YAML file, handing libyaml raw bytes instead of decoded text.
+    
+    Non-empty files are memory-mapped so the OS pages the content in directly
+    rather than copying it through a Python read buffer.
+    
+    Args:
+        path (str): Path to the YAML file
+        
+    Returns:
+        Any: Parsed YAML content (None for an empty document)
+        
+    Raises:
+        yaml.YAMLError: If the file cannot be parsed
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be memory-mapped
+            return yaml.load(f, Loader=_Loader)
+        with mapped:
+            return yaml.load(mapped, Loader=_Loader)
+
+def _read_yaml_cached(path: str, key: Tuple[str, int, int, int]) -> Any:
+    """
+    Parse a YAML file, reusing the previous result if the file is unchanged.
+    
+    The returned object is shared between callers and must be treated as read-only.
+    
+    Args:
+        path (str): Path to the YAML file
+        key (Tuple[str, int, int, int]): Stat key for the file, from _stat_key
+        
+    Returns:
+        Any: Parsed YAML content
+        
+    Raises:
+        yaml.YAMLError: If the file cannot be parsed
+    """
+    with _CACHE_LOCK:
+        cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    data = load_yaml_file(path)
+    
+    with _CACHE_LOCK:
+        _YAML_CACHE[path] = (key, data)
+    return data
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from YAML files and environment variables.
     
+    Parsed files and the merged result are cached until one of the
+    underlying files changes on disk, so repeated calls are cheap.
+    
     Args:
         config_path (Optional[str]): Path to a custom config file
         
@@ -27,54 +133,67 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     # Default config path
     default_config_path = os.path.join("config", "system_config.yaml")
+    agent_config_dir = os.path.join("config", "agent_config.yaml")
+    
+    default_key = _stat_key(default_config_path)
+    custom_key = _stat_key(config_path) if config_path else None
+    agent_key = _stat_key(agent_config_dir)
+    
+    # Reuse the merged config if none of the files have changed
+    merged_key = (default_key, custom_key, agent_key, config_path)
+    with _CACHE_LOCK:
+        cached = _MERGED_CACHE.get(config_path)
+    if cached is not None and cached[0] == merged_key:
+        logger.debug("Using cached configuration")
+        return process_env_vars(copy.deepcopy(cached[1]))
     
     # Start with empty config
     config = {}
     
     # Load from default config file if it exists
-    if os.path.exists(default_config_path):
-        with open(default_config_path, "r") as f:
-            try:
-                default_config = yaml.safe_load(f)
-                if default_config:
-                    config.update(default_config)
-                logger.info(f"Loaded configuration from {default_config_path}")
-            except yaml.YAMLError as e:
-                logger.error(f"Error parsing default config file: {e}")
+    if default_key is not None:
+        try:
+            default_config = _read_yaml_cached(default_config_path, default_key)
+            if default_config:
+                config.update(copy.deepcopy(default_config))
+            logger.info(f"Loaded configuration from {default_config_path}")
+        except yaml.YAMLError as e:
+            logger.error(f"Error parsing default config file: {e}")
     
     # Load from custom config file if provided and it exists
-    if config_path and os.path.exists(config_path):
-        with open(config_path, "r") as f:
-            try:
-                custom_config = yaml.safe_load(f)
-                if custom_config:
-                    # Deep merge the custom config into the default config
-                    deep_merge(config, custom_config)
-                logger.info(f"Loaded custom configuration from {config_path}")
-            except yaml.YAMLError as e:
-                logger.error(f"Error parsing custom config file: {e}")
+    if custom_key is not None:
+        try:
+            custom_config = _read_yaml_cached(config_path, custom_key)
+            if custom_config:
+                # Deep merge the custom config into the default config
+                deep_merge(config, copy.deepcopy(custom_config))
+            logger.info(f"Loaded custom configuration from {config_path}")
+        except yaml.YAMLError as e:
+            logger.error(f"Error parsing custom config file: {e}")
     
     # Load agent-specific configs from separate files
-    agent_config_dir = os.path.join("config", "agent_config.yaml")
-    if os.path.exists(agent_config_dir):
-        with open(agent_config_dir, "r") as f:
-            try:
-                agent_config = yaml.safe_load(f)
-                if agent_config and "agents" in agent_config:
-                    # If 'agents' key doesn't exist in config, create it
-                    if "agents" not in config:
-                        config["agents"] = {}
-                    # Merge each agent's config
-                    for agent_name, agent_settings in agent_config["agents"].items():
-                        if agent_name not in config["agents"]:
-                            config["agents"][agent_name] = {}
-                        config["agents"][agent_name].update(agent_settings)
-                logger.info(f"Loaded agent configurations from {agent_config_dir}")
-            except yaml.YAMLError as e:
-                logger.error(f"Error parsing agent config file: {e}")
-    
-    # Process environment variable references in the config
-    config = process_env_vars(config)
+    if agent_key is not None:
+        try:
+            agent_config = _read_yaml_cached(agent_config_dir, agent_key)
+            if agent_config and "agents" in agent_config:
+                # If 'agents' key doesn't exist in config, create it
+                if "agents" not in config:
+                    config["agents"] = {}
+                # Merge each agent's config
+                for agent_name, agent_settings in agent_config["agents"].items():
+                    if agent_name not in config["agents"]:
+                        config["agents"][agent_name] = {}
+                    config["agents"][agent_name].update(copy.deepcopy(agent_settings))
+            logger.info(f"Loaded agent configurations from {agent_config_dir}")
+        except yaml.YAMLError as e:
+            logger.error(f"Error parsing agent config file: {e}")
+    
+    with _CACHE_LOCK:
+        _MERGED_CACHE[config_path] = (merged_key, config)
+    
+    # Process environment variable references in the config. Environment
+    # variables are resolved on every call, so work on a private copy.
+    config = process_env_vars(copy.deepcopy(config))
     
     return config
 
@@ -82,49 +201,80 @@ def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> None:
     """
     Recursively merge two dictionaries, modifying the base dictionary in-place.
     
+    Nested dictionaries are merged using an explicit stack rather than recursion.
+    
     Args:
         base (Dict[str, Any]): Base dictionary to merge into
         override (Dict[str, Any]): Dictionary with values to override
     """
-    for key, value in override.items():
-        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-            # If both values are dictionaries, merge them recursively
-            deep_merge(base[key], value)
-        else:
-            # Otherwise, override the value in the base dictionary
-            base[key] = value
+    stack = [(base, override)]
+    while stack:
+        base_dict, override_dict = stack.pop()
+        for key, value in override_dict.items():
+            base_value = base_dict.get(key)
+            if isinstance(base_value, dict) and isinstance(value, dict):
+                # If both values are dictionaries, merge them level by level
+                stack.append((base_value, value))
+            else:
+                # Otherwise, override the value in the base dictionary
+                base_dict[key] = value
+
+def _expand_env_refs(value: str, env: Dict[str, str]) -> str:
+    """
+    Replace every ${VAR} reference in a string with the environment value.
+    
+    Args:
+        value (str): String that may contain environment variable references
+        env (Dict[str, str]): Snapshot of the environment to resolve against
+        
+    Returns:
+        str: String with known references replaced
+    """
+    def replace(match: "re.Match[str]") -> str:
+        env_var = match.group(1)
+        env_value = env.get(env_var)
+        if env_value is None:
+            # Keep the reference if the environment variable doesn't exist
+            logger.warning(f"Environment variable {env_var} not found")
+            return match.group(0)
+        logger.debug(f"Replaced environment variable {env_var} in config")
+        return env_value
+    
+    return _ENV_RE.sub(replace, value)
 
 def process_env_vars(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Process environment variable references in the configuration.
     
+    References may make up the whole value ("${VAR}") or be embedded in a
+    longer string ("prefix_${VAR}_suffix"). Nested dicts and lists are walked
+    iteratively and updated in place.
+    
     Args:
         config (Dict[str, Any]): Configuration dictionary
         
     Returns:
         Dict[str, Any]: Configuration with environment variables replaced
     """
-    if isinstance(config, dict):
-        for key, value in config.items():
+    # Snapshot the environment once; os.environ encodes/decodes keys on every lookup
+    env = dict(os.environ)
+    
+    stack = [config]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            entries = node.items()
+        elif isinstance(node, list):
+            entries = enumerate(node)
+        else:
+            continue
+        
+        for key, value in entries:
             if isinstance(value, (dict, list)):
-                # Recursively process nested dictionaries and lists
-                config[key] = process_env_vars(value)
-            elif isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                # Extract environment variable name
-                env_var = value[2:-1]
-                env_value = os.environ.get(env_var)
-                
-                if env_value is not None:
-                    # Replace the reference with the actual value
-                    config[key] = env_value
-                    logger.debug(f"Replaced environment variable {env_var} in config")
-                else:
-                    # Keep the reference if the environment variable doesn't exist
-                    logger.warning(f"Environment variable {env_var} not found")
-    elif isinstance(config, list):
-        # Process each item in the list
-        for i, item in enumerate(config):
-            config[i] = process_env_vars(item)
+                stack.append(value)
+            elif isinstance(value, str) and "${" in value:
+                # Assigning to an existing key/index doesn't resize the container
+                node[key] = _expand_env_refs(value, env)
     
     return config
 
@@ -167,23 +317,33 @@ def get_required_env_vars() -> Dict[str, str]:
     
     return env_vars
 
-def save_config(config: Dict[str, Any], file_path: str) -> bool:
+def save_config(config: Dict[str, Any], file_path: str, format: str = "yaml") -> bool:
     """
-    Save a configuration dictionary to a YAML file.
+    Save a configuration dictionary to a YAML or JSON file.
     
     Args:
         config (Dict[str, Any]): Configuration to save
         file_path (str): Path where to save the configuration
+        format (str): Output format, either "yaml" or "json"
         
     Returns:
         bool: True if saved successfully, False otherwise
     """
+    if format not in ("yaml", "json"):
+        logger.error(f"Unsupported configuration format: {format}")
+        return False
+    
     try:
         # Ensure directory exists
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
-        with open(file_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False)
+        if format == "json":
+            with open(file_path, "wb") as f:
+                f.write(_json_dumps(config))
+        else:
+            with open(file_path, "w") as f:
+                # Keep keys in insertion order; sorting every nested dict is wasted work
+                yaml.dump(config, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
         
         logger.info(f"Configuration saved to {file_path}")
         return True
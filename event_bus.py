@@ -5,13 +5,20 @@ Implements a publisher-subscriber pattern.
 
 import logging
 from typing import Dict, List, Callable, Any
-from collections import defaultdict
+from collections import deque
 import uuid
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import queue
+import itertools
+import threading
 
 from .message import Message
 
+# Policies for handling a publish when the delivery queue is full
+BACKPRESSURE_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+# Queue item that tells a worker thread to exit
+_STOP = object()
+
 class EventBus:
     """
     Event bus for agent communication using a publisher-subscriber pattern.
@@ -30,21 +37,38 @@ class EventBus:
         self.logger = logging.getLogger("core.event_bus")
         self.config = config or {}
         
-        # Dictionary of event_type -> list of subscribers
-        self.subscribers = defaultdict(list)
-        
-        # Thread pool for concurrent event handling
-        self.executor = ThreadPoolExecutor(
-            max_workers=self.config.get("max_workers", 10)
-        )
-        
-        # Event loop for async operation
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
+        # Dictionary of event_type -> {subscription_id: callback}. A plain dict,
+        # so lookups for event types nobody subscribed to don't add entries.
+        self.subscribers: Dict[str, Dict[str, Callable[[Message], None]]] = {}
+        
+        # Bounded delivery queue so slow subscribers can't grow memory without limit
+        self.backpressure = self.config.get("backpressure", "drop_oldest")
+        if self.backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Invalid backpressure policy: {self.backpressure}")
+        self.queue = queue.Queue(maxsize=self.config.get("queue_size", 10000))
+        
+        # How long a "block" publish waits for room before dropping the delivery.
+        # Agents publish from inside their callbacks, so an unbounded wait could
+        # leave every worker blocked on a full queue with nobody draining it.
+        self.block_timeout = self.config.get("block_timeout", 1.0)
+        
+        # Set by shutdown; no workers are left to deliver anything published afterwards
+        self.closed = False
+        
+        # Worker threads for concurrent event handling
+        self.workers = []
+        for i in range(self.config.get("max_workers", 10)):
+            worker = threading.Thread(
+                target=self._worker,
+                name=f"event-bus-worker-{i}",
+                daemon=True
+            )
+            worker.start()
+            self.workers.append(worker)
         
-        # Dictionary to store message history for debugging
-        self.message_history = []
+        # Bounded message history for debugging; the deque evicts the oldest entry
         self.max_history_size = self.config.get("max_history_size", 1000)
+        self.message_history = deque(maxlen=self.max_history_size)
         
         self.logger.info("Event bus initialized")
     
@@ -59,9 +83,12 @@ class EventBus:
         Returns:
             str: Subscription ID that can be used to unsubscribe
         """
-        subscription_id = str(uuid.uuid4())
-        self.subscribers[event_type].append((subscription_id, callback))
-        self.logger.debug(f"Added subscription to {event_type}, ID: {subscription_id}")
+        subscription_id = uuid.uuid4().hex
+        event_subscribers = self.subscribers.get(event_type)
+        if event_subscribers is None:
+            event_subscribers = self.subscribers[event_type] = {}
+        event_subscribers[subscription_id] = callback
+        self.logger.debug("Added subscription to %s, ID: %s", event_type, subscription_id)
         return subscription_id
     
     def unsubscribe(self, event_type: str, subscription_id: str) -> bool:
@@ -75,25 +102,18 @@ class EventBus:
         Returns:
             bool: True if unsubscribed successfully, False otherwise
         """
-        if event_type not in self.subscribers:
+        event_subscribers = self.subscribers.get(event_type)
+        if event_subscribers is None or subscription_id not in event_subscribers:
             return False
-            
-        initial_length = len(self.subscribers[event_type])
-        self.subscribers[event_type] = [
-            (sub_id, callback) 
-            for sub_id, callback in self.subscribers[event_type] 
-            if sub_id != subscription_id
-        ]
         
-        success = len(self.subscribers[event_type]) < initial_length
-        if success:
-            self.logger.debug(f"Removed subscription to {event_type}, ID: {subscription_id}")
+        del event_subscribers[subscription_id]
+        self.logger.debug("Removed subscription to %s, ID: %s", event_type, subscription_id)
         
         # Clean up empty event types
-        if not self.subscribers[event_type]:
+        if not event_subscribers:
             del self.subscribers[event_type]
             
-        return success
+        return True
     
     def publish(self, message: Message) -> None:
         """
@@ -102,47 +122,96 @@ class EventBus:
         Args:
             message (Message): The message to publish
         """
-        if not isinstance(message, Message):
-            self.logger.error(f"Cannot publish: expected Message object, got {type(message)}")
+        if type(message) is not Message and not isinstance(message, Message):
+            self.logger.error("Cannot publish: expected Message object, got %s", type(message))
+            return
+        
+        if self.closed:
+            self.logger.error("Cannot publish %s: event bus is shut down", message.type_name)
             return
         
         # Add to message history
-        if len(self.message_history) >= self.max_history_size:
-            self.message_history.pop(0)  # Remove oldest message
         self.message_history.append(message)
         
-        # Get all subscribers for this event type
-        event_type = message.type
-        if event_type not in self.subscribers:
-            self.logger.debug(f"No subscribers for event type: {event_type}")
+        # Get all subscribers for this event type. Agents subscribe by event
+        # type name, so look up by name rather than by the enum member.
+        event_type = message.type_name
+        event_subscribers = self.subscribers.get(event_type)
+        if not event_subscribers:
+            self.logger.debug("No subscribers for event type: %s", event_type)
+            return
+        
+        # Snapshot the callbacks so concurrent (un)subscribes can't affect this publish
+        callbacks = tuple(event_subscribers.values())
+        self.logger.debug("Publishing %s event to %d subscribers", event_type, len(callbacks))
+        
+        # Hand callbacks to the worker threads to avoid blocking the publisher
+        for callback in callbacks:
+            self._enqueue((callback, message))
+    
+    def _enqueue(self, item: Any) -> None:
+        """
+        Add a delivery to the worker queue, applying the backpressure policy if it is full.
+        
+        Args:
+            item (Any): (callback, message) pair to deliver
+        """
+        if self.backpressure == "block":
+            try:
+                self.queue.put(item, timeout=self.block_timeout)
+            except queue.Full:
+                self.logger.warning(
+                    "Event queue still full after %.1fs, dropping newest delivery", self.block_timeout
+                )
             return
+        
+        while True:
+            try:
+                self.queue.put_nowait(item)
+                return
+            except queue.Full:
+                if self.backpressure == "drop_newest":
+                    self.logger.warning("Event queue full, dropping newest delivery")
+                    return
             
-        subscriber_count = len(self.subscribers[event_type])
-        self.logger.debug(f"Publishing {event_type} event to {subscriber_count} subscribers")
-        
-        # Process in event loop to ensure thread safety
-        for _, callback in self.subscribers[event_type]:
-            asyncio.run_coroutine_threadsafe(
-                self._async_call_subscriber(callback, message),
-                self.loop
-            )
+            # drop_oldest: discard the head of the queue and retry
+            try:
+                oldest = self.queue.get_nowait()
+            except queue.Empty:
+                continue
+            self.queue.task_done()
+            if oldest is _STOP:
+                # Shutdown has started; a lost stop marker would leave a worker
+                # running forever, so put it back and drop this delivery instead
+                self.queue.put(oldest)
+                self.logger.warning("Event queue full during shutdown, dropping newest delivery")
+                return
+            self.logger.warning("Event queue full, dropped oldest delivery")
+    
+    def _worker(self) -> None:
+        """Deliver queued messages to subscriber callbacks until told to stop."""
+        while True:
+            item = self.queue.get()
+            try:
+                if item is _STOP:
+                    return
+                callback, message = item
+                self._safe_call(callback, message)
+            finally:
+                self.queue.task_done()
     
-    async def _async_call_subscriber(self, callback: Callable, message: Message) -> None:
+    def _safe_call(self, callback: Callable, message: Message) -> None:
         """
-        Asynchronously call a subscriber callback with a message.
+        Call a subscriber callback with a message, logging any exception.
         
         Args:
             callback (Callable): The subscriber callback
             message (Message): The message to pass to the callback
         """
         try:
-            # Run callback in thread pool to avoid blocking
-            await self.loop.run_in_executor(
-                self.executor,
-                lambda: callback(message)
-            )
+            callback(message)
         except Exception as e:
-            self.logger.error(f"Error in subscriber callback: {str(e)}", exc_info=True)
+            self.logger.error("Error in subscriber callback: %s", e, exc_info=True)
     
     def get_recent_messages(self, limit: int = 50) -> List[Message]:
         """
@@ -154,17 +223,21 @@ class EventBus:
         Returns:
             List[Message]: List of recent messages
         """
-        return self.message_history[-limit:] if self.message_history else []
+        if limit <= 0:
+            return []
+        start = max(0, len(self.message_history) - limit)
+        return list(itertools.islice(self.message_history, start, None))
     
     def shutdown(self) -> None:
         """Shut down the event bus and release resources."""
         self.logger.info("Shutting down event bus")
-        self.executor.shutdown(wait=True)
+        self.closed = True
+        
+        # Queued deliveries are processed before the workers see the stop marker
+        for _ in self.workers:
+            self.queue.put(_STOP)
+        for worker in self.workers:
+            worker.join()
+        self.workers = []
         
-        # Cancel all pending tasks
-        for task in asyncio.all_tasks(self.loop):
-            task.cancel()
-            
-        # Close the event loop
-        self.loop.close()
         self.logger.info("Event bus shut down")
@@ -2,11 +2,16 @@
 Message class for communication between agents via the event bus.
 """
 
-import uuid
+import os
+import sys
 import time
+import threading
 from typing import Dict, Any, Optional, List
 from enum import Enum, auto
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+
+# Slotted dataclasses drop the per-instance __dict__; only available on Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class MessageType(Enum):
@@ -45,7 +50,62 @@ class MessageType(Enum):
     CONTEXT_UPDATED = auto()
 
 
-@dataclass
+# Precomputed lookups so construction avoids the enum metaclass machinery
+_MT_BY_NAME: Dict[str, MessageType] = {m.name: m for m in MessageType}
+_MT_NAME: Dict[MessageType, str] = {m: m.name for m in MessageType}
+
+
+_NS_PER_SECOND = 1_000_000_000
+
+# Random bytes drawn in bulk so message IDs don't cost a syscall each
+_ID_BYTES = 16
+_ID_BUFFER_SIZE = 4096
+_id_buffer = bytearray()
+_id_lock = threading.Lock()
+
+
+def _reset_id_buffer() -> None:
+    """Discard buffered random bytes so a forked child can't reuse the parent's IDs."""
+    global _id_buffer
+    _id_buffer = bytearray()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_buffer)
+
+
+def _new_message_id() -> str:
+    """
+    Generate a unique message ID.
+    
+    Returns:
+        str: 32-character hex string of 128 random bits
+    """
+    global _id_buffer
+    with _id_lock:
+        if len(_id_buffer) < _ID_BYTES:
+            _id_buffer = bytearray(os.urandom(_ID_BUFFER_SIZE))
+        id_bytes = _id_buffer[:_ID_BYTES]
+        del _id_buffer[:_ID_BYTES]
+    return id_bytes.hex()
+
+
+def _seconds_to_ns(seconds: float) -> int:
+    """
+    Convert a serialized timestamp in seconds to integer nanoseconds.
+    
+    A float of seconds since the epoch only resolves a few hundred
+    nanoseconds, so this is lossy; from_dict prefers "timestamp_ns" when present.
+    """
+    return round(seconds * _NS_PER_SECOND)
+
+
+def _copy_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a metadata dict for a derived message, skipping the copy when empty."""
+    return dict(metadata) if metadata else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Message:
     """
     Message object for communication between agents.
@@ -62,8 +122,8 @@ class Message:
     # Metadata fields
     sender: Optional[str] = None  # ID of the sending agent
     recipient: Optional[str] = None  # ID of intended recipient (if any)
-    timestamp: float = field(default_factory=time.time)  # When the message was created
-    message_id: str = field(default_factory=lambda: str(uuid.uuid4()))  # Unique ID
+    timestamp: int = field(default_factory=time.time_ns)  # When the message was created (ns since epoch)
+    message_id: str = field(default_factory=_new_message_id)  # Unique ID
     
     # Fields for message threading and context
     parent_id: Optional[str] = None  # ID of the parent message if this is a reply
@@ -77,16 +137,27 @@ class Message:
     
     def __post_init__(self):
         """Validate and perform any post-initialization setup."""
-        # Convert MessageType enum to string for serialization if needed
-        if isinstance(self.type, MessageType):
-            self.type_name = self.type.name
-        else:
-            # If passed as string, try to convert to enum
+        # If passed as string, try to convert to enum.
+        # MessageType has no subclasses, so an exact class check is enough.
+        msg_type = self.type
+        if msg_type.__class__ is not MessageType:
             try:
-                self.type = MessageType[self.type]
-                self.type_name = self.type.name
-            except (KeyError, TypeError):
-                raise ValueError(f"Invalid message type: {self.type}")
+                resolved = _MT_BY_NAME.get(msg_type)
+            except TypeError:
+                resolved = None
+            if resolved is None:
+                raise ValueError(f"Invalid message type: {msg_type}")
+            self.type = resolved
+    
+    @property
+    def type_name(self) -> str:
+        """
+        Name of the message type, used for serialization and event routing.
+        
+        Returns:
+            str: The MessageType member name
+        """
+        return _MT_NAME[self.type]
     
     def is_expired(self) -> bool:
         """
@@ -97,8 +168,7 @@ class Message:
         """
         if self.ttl is None:
             return False
-        current_time = time.time()
-        return (current_time - self.timestamp) > self.ttl
+        return (time.time_ns() - self.timestamp) > self.ttl * _NS_PER_SECOND
     
     def with_content(self, **kwargs) -> 'Message':
         """
@@ -110,24 +180,18 @@ class Message:
         Returns:
             Message: A new message with updated content
         """
-        # Create a shallow copy of the content dictionary
-        new_content = dict(self.content)
-        
-        # Update with the provided key-value pairs
-        new_content.update(kwargs)
+        # Copy the content dictionary with the provided key-value pairs applied
+        new_content = {**self.content, **kwargs}
         
-        # Create a new message with the updated content
-        return Message(
-            type=self.type,
+        # Create a new message with the updated content. All other fields are
+        # carried over, except the identity fields which must be fresh.
+        return replace(
+            self,
             content=new_content,
-            sender=self.sender,
-            recipient=self.recipient,
             parent_id=self.message_id,  # Set the new message's parent to this message
-            context_id=self.context_id,
-            thread_id=self.thread_id,
-            priority=self.priority,
-            ttl=self.ttl,
-            metadata=dict(self.metadata)
+            message_id=_new_message_id(),
+            timestamp=time.time_ns(),
+            metadata=_copy_metadata(self.metadata)
         )
     
     def create_reply(self, message_type: MessageType, content: Dict[str, Any]) -> 'Message':
@@ -150,7 +214,7 @@ class Message:
             context_id=self.context_id,
             thread_id=self.thread_id,
             priority=self.priority,
-            metadata=dict(self.metadata)
+            metadata=_copy_metadata(self.metadata)
         )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -166,7 +230,8 @@ class Message:
             "content": self.content,
             "sender": self.sender,
             "recipient": self.recipient,
-            "timestamp": self.timestamp,
+            "timestamp": self.timestamp / _NS_PER_SECOND,  # Seconds, for compatibility
+            "timestamp_ns": self.timestamp,  # Exact value, so from_dict round-trips
             "parent_id": self.parent_id,
             "context_id": self.context_id,
             "thread_id": self.thread_id,
@@ -186,26 +251,35 @@ class Message:
         Returns:
             Message: A new message created from the dictionary
         """
-        # Handle the message type conversion
-        msg_type = data.pop("type")
+        # Handle the message type conversion without mutating the caller's dict
+        msg_type = data["type"]
         if isinstance(msg_type, str):
-            try:
-                msg_type = MessageType[msg_type]
-            except KeyError:
+            resolved = _MT_BY_NAME.get(msg_type)
+            if resolved is None:
                 raise ValueError(f"Invalid message type: {msg_type}")
+            msg_type = resolved
+        
+        # Only generate defaults when the fields are actually missing
+        timestamp = data.get("timestamp_ns")
+        if timestamp is None:
+            timestamp = data.get("timestamp")
+            timestamp = time.time_ns() if timestamp is None else _seconds_to_ns(timestamp)
+        message_id = data.get("message_id")
+        if message_id is None:
+            message_id = _new_message_id()
         
         # Create the message from the dictionary
         return cls(
             type=msg_type,
-            content=data.get("content", {}),
+            content=data.get("content") or {},
             sender=data.get("sender"),
             recipient=data.get("recipient"),
-            timestamp=data.get("timestamp", time.time()),
-            message_id=data.get("message_id", str(uuid.uuid4())),
+            timestamp=timestamp,
+            message_id=message_id,
             parent_id=data.get("parent_id"),
             context_id=data.get("context_id"),
             thread_id=data.get("thread_id"),
             priority=data.get("priority", 0),
             ttl=data.get("ttl"),
-            metadata=data.get("metadata", {})
+            metadata=data.get("metadata") or {}
         )
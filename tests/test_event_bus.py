@@ -0,0 +1,80 @@
+"""
+Tests for the event bus delivery queue and its backpressure policies.
+"""
+
+import threading
+
+from core.event_bus import EventBus, _STOP
+from core.message import Message, MessageType
+
+
+def _shutdown_within(bus: EventBus, seconds: float) -> bool:
+    """Shut the bus down on another thread and report whether it finished in time."""
+    thread = threading.Thread(target=bus.shutdown, daemon=True)
+    thread.start()
+    thread.join(seconds)
+    return not thread.is_alive()
+
+
+def test_block_policy_survives_publishing_from_callbacks():
+    # One worker and a one-slot queue: the second publish from inside the
+    # callback can only succeed if the worker itself drains the queue
+    bus = EventBus({
+        "queue_size": 1,
+        "max_workers": 1,
+        "backpressure": "block",
+        "block_timeout": 0.05
+    })
+    delivered = []
+    
+    # Like an agent replying from its handler: every delivery publishes more
+    def republish(message: Message):
+        depth = message.content["depth"]
+        delivered.append(depth)
+        if depth < 2:
+            for _ in range(2):
+                bus.publish(Message(MessageType.LOG, {"depth": depth + 1}))
+    
+    bus.subscribe(MessageType.LOG.name, republish)
+    bus.publish(Message(MessageType.LOG, {"depth": 0}))
+    
+    # The worker must give up on the full queue rather than deadlock
+    assert _shutdown_within(bus, 10)
+    assert delivered[0] == 0
+    assert 1 in delivered
+
+
+def test_drop_oldest_keeps_stop_marker():
+    bus = EventBus({"queue_size": 1, "max_workers": 1, "backpressure": "drop_oldest"})
+    release = threading.Event()
+    started = threading.Event()
+    
+    def wait_for_release(message: Message):
+        started.set()
+        release.wait()
+    
+    bus.subscribe(MessageType.LOG.name, wait_for_release)
+    bus.publish(Message(MessageType.LOG, {}))
+    assert started.wait(5)
+    
+    # A stop marker at the head of a full queue must not be the one dropped
+    bus.queue.put(_STOP)
+    bus.publish(Message(MessageType.LOG, {}))
+    assert list(bus.queue.queue) == [_STOP]
+    
+    release.set()
+    bus.workers[0].join(5)
+    assert not bus.workers[0].is_alive()
+
+
+def test_publish_after_shutdown_is_refused():
+    bus = EventBus({"queue_size": 1, "max_workers": 1, "backpressure": "block"})
+    received = []
+    bus.subscribe(MessageType.LOG.name, received.append)
+    bus.shutdown()
+    
+    for _ in range(3):
+        bus.publish(Message(MessageType.LOG, {}))
+    
+    assert bus.queue.empty()
+    assert received == []
@@ -2,24 +2,261 @@
 Transcriber Agent that converts audio to text and identifies speakers.
 """
 
+import io
 import os
 import logging
 import time
-import json
-from typing import Dict, Any, List, Optional, Tuple
+import atexit
+import asyncio
+import struct
+import threading
+import wave
+from typing import Dict, Any, List, Optional, Tuple, Coroutine, TYPE_CHECKING
 import tempfile
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor, Future
 
-import speech_recognition as sr
-from pydub import AudioSegment
-import librosa
 import numpy as np
-from openai import OpenAI
+from numpy.lib.stride_tricks import sliding_window_view
+import soundfile as sf
+
+# librosa, speech_recognition and openai are slow to import and only needed
+# by some code paths, so they are imported where they are used
+if TYPE_CHECKING:
+    import speech_recognition as sr
 
 from .base_agent import BaseAgent
 from ..core.message import Message, MessageType
 from ..utils.audio_processing import AudioProcessor
 from ..models.meeting import MeetingTranscript, TranscriptSegment
 
+# orjson parses large Whisper responses much faster; fall back to the standard library
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# Module-level logger for the helpers below; agents log through self.logger
+logger = logging.getLogger("agent.transcriber")
+
+
+def _plan_transcription_chunks(
+    speech_intervals: np.ndarray,
+    duration: float,
+    target_seconds: float
+) -> List[Tuple[float, float]]:
+    """
+    Split an audio timeline into chunks of roughly target_seconds each.
+    
+    Cut points are placed halfway through the silence between two speech
+    regions, once the current chunk has reached the target length.
+    
+    Args:
+        speech_intervals (np.ndarray): Time-ordered (n, 2) [start, end) times in seconds
+        duration (float): Total audio duration in seconds
+        target_seconds (float): Desired chunk length in seconds
+        
+    Returns:
+        List[Tuple[float, float]]: (start, end) times in seconds covering the whole audio
+    """
+    cuts = [0.0]
+    for (_, current_end), (following_start, _) in zip(speech_intervals, speech_intervals[1:]):
+        if current_end - cuts[-1] >= target_seconds:
+            cuts.append(float(current_end + following_start) / 2)
+    cuts.append(duration)
+    return list(zip(cuts, cuts[1:]))
+
+def _make_wav_header(
+    num_samples: int,
+    sample_rate: int,
+    channels: int = 1,
+    bits_per_sample: int = 16
+) -> bytes:
+    """
+    Build the 44-byte header of a PCM WAV file.
+    
+    Args:
+        num_samples (int): Number of samples per channel in the data chunk
+        sample_rate (int): Samples per second
+        channels (int): Number of interleaved channels
+        bits_per_sample (int): Bits per sample
+        
+    Returns:
+        bytes: RIFF/WAVE header to prepend to the raw little-endian PCM data
+    """
+    block_align = channels * bits_per_sample // 8
+    data_size = num_samples * block_align
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, bits_per_sample,
+        b"data", data_size
+    )
+
+# Compiled silence-split kernel; None until first use, False if it can't be used
+_rms_split_kernel = None
+
+def _disable_rms_split_kernel(error: Exception) -> None:
+    """
+    Stop using the numba kernel after a failure, so later calls use NumPy.
+    
+    Args:
+        error (Exception): Why the kernel could not be built or run
+    """
+    global _rms_split_kernel
+    _rms_split_kernel = False
+    logger.warning(f"numba silence detection unavailable, using NumPy instead: {error}")
+
+def _get_rms_split_kernel():
+    """
+    Compile the numba silence-split kernel on first use.
+    
+    numba is imported here rather than at module level so that importing this
+    module stays cheap; cache=True keeps the compiled code on disk between runs.
+    
+    Returns:
+        Optional[Callable]: The compiled kernel, or None if numba can't be used
+    """
+    global _rms_split_kernel
+    if _rms_split_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _rms_split_kernel = False
+        else:
+            try:
+                # Caching needs the module's source on disk, which sourceless
+                # and frozen installs don't have
+                _rms_split_kernel = njit(cache=True, fastmath=True)(_rms_split)
+            except Exception as e:
+                _disable_rms_split_kernel(e)
+    return _rms_split_kernel or None
+
+def _rms_split(y, frame_length, hop_length, top_db):
+    """
+    Single-pass silence split over 16-bit PCM, compiled by _get_rms_split_kernel.
+    
+    Frame energies are kept as a running integer sum of squares, adding the
+    samples that enter the window and subtracting those that leave, so the
+    cost is O(len(y)) rather than O(len(y) * frame_length) and no frame
+    array is materialised. Squares of int16 samples are summed in int64, so
+    the energies are exact.
+    
+    Args:
+        y (np.ndarray): Mono int16 samples
+        frame_length (int): Samples per analysis frame
+        hop_length (int): Samples between successive frames
+        top_db (float): Threshold below the peak, in dB, under which a frame is silent
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Start and end sample indices of the non-silent intervals
+    """
+    n = len(y)
+    pad = frame_length // 2
+    padded_length = max(n + 2 * pad, frame_length)
+    n_frames = 1 + (padded_length - frame_length) // hop_length
+    
+    # Sum of squares of the centred window [lo, hi) of the zero-padded signal
+    energy = np.zeros(n_frames, dtype=np.int64)
+    total = 0
+    lo = 0
+    hi = 0
+    for k in range(n_frames):
+        new_lo = k * hop_length
+        new_hi = new_lo + frame_length
+        if new_lo >= hi:
+            total = 0
+            hi = new_lo
+        else:
+            for p in range(max(lo, pad), min(new_lo, n + pad)):
+                total -= np.int64(y[p - pad]) * y[p - pad]
+        for p in range(max(hi, pad), min(new_hi, n + pad)):
+            total += np.int64(y[p - pad]) * y[p - pad]
+        lo = new_lo
+        hi = new_hi
+        energy[k] = total
+    
+    starts = np.empty(n_frames, dtype=np.int64)
+    ends = np.empty(n_frames, dtype=np.int64)
+    count = 0
+    peak = energy.max() / frame_length
+    if peak <= 0:
+        return starts[:0], ends[:0]
+    
+    # Same test as the NumPy path: mean square within top_db of the loudest frame
+    in_speech = False
+    for k in range(n_frames):
+        mean_square = max(energy[k] / frame_length, 1e-10)
+        non_silent = 10.0 * np.log10(mean_square / peak) > -top_db
+        if non_silent and not in_speech:
+            starts[count] = min(k * hop_length, n)
+            in_speech = True
+        elif not non_silent and in_speech:
+            ends[count] = min(k * hop_length, n)
+            count += 1
+            in_speech = False
+    if in_speech:
+        ends[count] = min(n_frames * hop_length, n)
+        count += 1
+    
+    return starts[:count], ends[:count]
+
+def _split_non_silent(
+    audio: np.ndarray,
+    top_db: float,
+    frame_length: int,
+    hop_length: int
+) -> np.ndarray:
+    """
+    Find the non-silent intervals of a signal, in the manner of librosa.effects.split.
+    
+    Frames are centred on multiples of hop_length. A frame counts as non-silent
+    when its RMS energy is within top_db decibels of the loudest frame.
+    
+    Args:
+        audio (np.ndarray): Mono samples
+        top_db (float): Threshold below the peak, in dB, under which a frame is silent
+        frame_length (int): Samples per analysis frame
+        hop_length (int): Samples between successive frames
+        
+    Returns:
+        np.ndarray: (n, 2) array of [start, end) sample indices
+    """
+    if len(audio) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    
+    # 16-bit PCM goes through the compiled kernel when numba is available
+    if audio.dtype == np.int16:
+        kernel = _get_rms_split_kernel()
+        if kernel is not None:
+            try:
+                starts, ends = kernel(audio, frame_length, hop_length, float(top_db))
+                return np.stack((starts, ends), axis=1)
+            except Exception as e:
+                # Compilation happens on the first call and may fail there
+                _disable_rms_split_kernel(e)
+    
+    # Centre the frames and take per-frame mean square energy. einsum reads the
+    # overlapping window view in place instead of materialising every frame.
+    padded = np.pad(audio, frame_length // 2)
+    if len(padded) < frame_length:
+        padded = np.pad(padded, (0, frame_length - len(padded)))
+    frames = sliding_window_view(padded, frame_length)[::hop_length]
+    mean_square = np.einsum("ij,ij->i", frames, frames, dtype=np.float64) / frame_length
+    
+    peak = mean_square.max()
+    if peak <= 0:
+        return np.empty((0, 2), dtype=np.int64)
+    
+    # Compare in dB against the loudest frame (power ratio, hence 10 * log10)
+    db = 10.0 * np.log10(np.maximum(mean_square, 1e-10) / peak)
+    non_silent = db > -top_db
+    
+    # Rising and falling edges of the mask give the interval boundaries
+    edges = np.flatnonzero(np.diff(non_silent.astype(np.int8), prepend=0, append=0))
+    intervals = edges.reshape(-1, 2) * hop_length
+    return np.minimum(intervals, len(audio))
+
 class TranscriberAgent(BaseAgent):
     """
     Agent responsible for transcribing audio into text with speaker identification.
@@ -35,12 +272,25 @@ class TranscriberAgent(BaseAgent):
         """
         super().__init__("transcriber", config_path)
         
-        # Initialize OpenAI client for transcription if configured to use it
+        # Initialize OpenAI client for transcription if configured to use it.
+        # This is the only client the agent uses: parallel chunk uploads share
+        # its connection pool and are multiplexed over HTTP/2 instead of each
+        # paying for its own TCP and TLS handshake.
         self.openai_client = None
         if self.config["llm"]["provider"] == "openai":
+            import httpx
+            from openai import OpenAI
+            
             self.openai_client = OpenAI(
-                api_key=self.config["llm"]["api_key"]
+                api_key=self.config["llm"]["api_key"],
+                http_client=httpx.Client(
+                    http2=True,
+                    timeout=60,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+                )
             )
+            # Safety net for agents that are never shut down; close() unregisters it
+            atexit.register(self.openai_client.close)
         
         # Audio configuration
         self.sample_rate = self.agent_config.get("sample_rate", 16000)
@@ -49,13 +299,29 @@ class TranscriberAgent(BaseAgent):
         self.silence_threshold = self.agent_config.get("silence_threshold", 500)
         self.silence_duration = self.agent_config.get("silence_duration", 1.0)
         
+        # Seconds of 16-bit audio to reserve up front for live recordings
+        self.recording_buffer_seconds = self.agent_config.get("recording_buffer_seconds", 600)
+        
+        # Number of new chunks to collect before announcing them during live recording
+        self.capture_batch_chunks = self.agent_config.get("capture_batch_chunks", 3)
+        
         # Speaker diarization settings
         self.speaker_diarization = self.agent_config.get("speaker_diarization", True)
         self.min_speaker_segments = self.agent_config.get("min_speaker_segments", 3)
         
+        # Speaker labels are built once and shared by every transcript segment
+        self._speaker_labels = tuple(f"Speaker {i + 1}" for i in range(4))
+        
         # Confidence threshold for accepting transcriptions
         self.confidence_threshold = self.agent_config.get("confidence_threshold", 0.85)
         
+        # Long recordings are split into chunks that are transcribed concurrently
+        self.transcription_chunk_seconds = self.agent_config.get("transcription_chunk_seconds", 45)
+        self.max_concurrent_transcriptions = self.agent_config.get("max_concurrent_transcriptions", 5)
+        
+        # Files with less detected speech than this (in seconds) are not sent to Whisper
+        self.min_voiced_seconds = self.agent_config.get("min_voiced_seconds", 0.5)
+        
         # Audio processing utilities
         self.audio_processor = AudioProcessor(
             sample_rate=self.sample_rate,
@@ -65,13 +331,145 @@ class TranscriberAgent(BaseAgent):
             silence_duration=self.silence_duration
         )
         
-        # For live audio recording
-        self.recognizer = sr.Recognizer()
+        # For live audio recording; the recognizer is created on the first recording
+        self.recognizer = None
         self.is_recording = False
         self.current_recording = None
         
+        # Energy threshold from the last ambient noise calibration; reused for
+        # later recordings until a "recalibrate_mic" command clears it
+        self._calibrated_threshold: Optional[float] = None
+        
+        # Messages are handled on the agent's own event loop so that a long
+        # transcription doesn't hold up the other commands it receives
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._run_loop,
+            name="transcriber-loop",
+            daemon=True
+        )
+        self._loop_thread.start()
+        self._pending_tasks = set()
+        
+        # Handlers block on Whisper requests that run in the loop's default
+        # executor, so they get their own pool; sharing one could fill it with
+        # handlers waiting on requests that never get a thread
+        self._handler_executor = ThreadPoolExecutor(thread_name_prefix="transcriber-handler")
+        self._message_queue = self._submit(self._start_dispatcher()).result()
+        
         self.logger.info("Transcriber Agent initialized")
     
+    def _run_loop(self):
+        """Run the agent's event loop until shutdown is called."""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+    
+    def _submit(self, coro: Coroutine) -> Future:
+        """
+        Schedule a coroutine on the agent's event loop from any thread.
+        
+        Args:
+            coro (Coroutine): The coroutine to run
+            
+        Returns:
+            Future: Future holding the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+    
+    async def _start_dispatcher(self) -> asyncio.Queue:
+        """
+        Create the incoming message queue and start the task that drains it.
+        
+        Returns:
+            asyncio.Queue: Queue that handle_message feeds
+        """
+        # Created on the loop itself so it is bound to the right loop on older Pythons
+        message_queue = asyncio.Queue()
+        self._dispatcher_task = self._loop.create_task(self._dispatch_messages(message_queue))
+        return message_queue
+    
+    async def _dispatch_messages(self, message_queue: asyncio.Queue):
+        """
+        Start a task for every queued message so they are handled concurrently.
+        
+        Args:
+            message_queue (asyncio.Queue): Queue of incoming messages
+        """
+        while True:
+            message = await message_queue.get()
+            task = self._loop.create_task(self._handle_message_async(message))
+            # Keep a reference until the task finishes so it isn't garbage collected
+            self._pending_tasks.add(task)
+            task.add_done_callback(self._pending_tasks.discard)
+    
+    async def _handle_message_async(self, message: Message):
+        """
+        Handle a message on the event loop, running the blocking work in a thread.
+        
+        Args:
+            message (Message): The message to handle
+        """
+        handler = None
+        if message.type == MessageType.AUDIO_CAPTURED:
+            handler = self.process_audio
+        elif message.type == MessageType.SYSTEM_COMMAND:
+            command = message.content.get("command")
+            if command == "start_recording":
+                handler = self.start_recording
+            elif command == "stop_recording":
+                handler = self.stop_recording
+            elif command == "recalibrate_mic":
+                handler = self.recalibrate_microphone
+        
+        if handler is None:
+            return
+        
+        try:
+            await self._loop.run_in_executor(self._handler_executor, handler, message)
+        except Exception as e:
+            self.logger.error(f"Error handling {message.type_name} message: {e}", exc_info=True)
+    
+    async def _stop_dispatcher(self):
+        """Stop starting queued messages and wait for the ones already running."""
+        self._dispatcher_task.cancel()
+        try:
+            await self._dispatcher_task
+        except asyncio.CancelledError:
+            pass
+        if self._pending_tasks:
+            await asyncio.gather(*self._pending_tasks, return_exceptions=True)
+    
+    def close(self):
+        """Close the OpenAI client and its connection pool."""
+        if self.openai_client is None:
+            return
+        atexit.unregister(self.openai_client.close)
+        self.openai_client.close()
+        self.openai_client = None
+    
+    def shutdown(self):
+        """
+        Stop the agent's event loop, wait for its thread to exit and close the OpenAI client.
+        
+        Messages already being handled are allowed to finish first; they still
+        need the loop and the client for their Whisper requests. Messages that
+        were queued but not yet started are dropped, and a live recording is
+        stopped without being processed.
+        """
+        if self._loop.is_running():
+            # A recording handler only returns once recording stops
+            if self.is_recording:
+                self.logger.warning("Shutting down during a recording, discarding it")
+                self.is_recording = False
+            
+            self._submit(self._stop_dispatcher()).result()
+            self._handler_executor.shutdown(wait=True)
+            
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
+        self.close()
+    
     def get_subscribed_events(self) -> List[str]:
         """
         Get the events this agent subscribes to.
@@ -88,17 +486,13 @@ class TranscriberAgent(BaseAgent):
         """
         Handle incoming messages.
         
+        The message is queued on the agent's event loop and handled there, so
+        this returns without waiting for the work to finish.
+        
         Args:
             message (Message): The message to handle
         """
-        if message.type == MessageType.AUDIO_CAPTURED:
-            self.process_audio(message)
-        elif message.type == MessageType.SYSTEM_COMMAND:
-            command = message.content.get("command")
-            if command == "start_recording":
-                self.start_recording(message)
-            elif command == "stop_recording":
-                self.stop_recording(message)
+        self._loop.call_soon_threadsafe(self._message_queue.put_nowait, message)
     
     def start_recording(self, message: Message):
         """
@@ -117,23 +511,42 @@ class TranscriberAgent(BaseAgent):
         
         # Initialize recording state
         self.is_recording = True
+        # PCM from every chunk is written into one pre-reserved buffer instead
+        # of keeping a list of AudioData objects; it grows only if the meeting
+        # outlasts the reservation
         self.current_recording = {
             "meeting_id": meeting_id,
             "start_time": time.time(),
-            "audio_chunks": [],
+            "audio_buffer": bytearray(self.sample_rate * 2 * self.recording_buffer_seconds),
+            "bytes_written": 0,
+            "chunk_count": 0,
+            "chunks_notified": 0,
+            "sample_width": None,
+            "sample_rate": None,
             "audio_file": None
         }
         
         self.logger.info(f"Started recording for meeting {meeting_id}")
         
-        # Start recording in a separate thread
+        # Runs until stop_recording; handle_message calls this on a worker thread
         self._record_audio()
     
     def _record_audio(self):
         """Record audio in chunks and process for silence detection."""
+        import speech_recognition as sr
+        
+        if self.recognizer is None:
+            self.recognizer = sr.Recognizer()
+        
         try:
             with sr.Microphone(sample_rate=self.sample_rate) as source:
-                self.recognizer.adjust_for_ambient_noise(source)
+                # Calibration listens to the room for about a second, so only
+                # do it for the first recording or after a recalibrate command
+                if self._calibrated_threshold is not None:
+                    self.recognizer.energy_threshold = self._calibrated_threshold
+                else:
+                    self.recognizer.adjust_for_ambient_noise(source)
+                    self._calibrated_threshold = self.recognizer.energy_threshold
                 
                 while self.is_recording:
                     try:
@@ -145,10 +558,11 @@ class TranscriberAgent(BaseAgent):
                         )
                         
                         # Store the audio chunk
-                        self.current_recording["audio_chunks"].append(audio_data)
+                        self._append_recording_audio(audio_data)
                         
-                        # Process this chunk if we have enough data
-                        if len(self.current_recording["audio_chunks"]) >= 3:
+                        # Notify once enough new chunks have accumulated since the last batch
+                        recording = self.current_recording
+                        if recording["chunk_count"] - recording["chunks_notified"] >= self.capture_batch_chunks:
                             self._process_recording_chunk()
                             
                     except sr.WaitTimeoutError:
@@ -160,21 +574,64 @@ class TranscriberAgent(BaseAgent):
             self.logger.error(f"Error setting up audio recording: {e}")
             self.is_recording = False
     
+    def recalibrate_microphone(self, message: Message):
+        """
+        Discard the stored ambient noise calibration.
+        
+        The microphone is calibrated again the next time a recording starts.
+        
+        Args:
+            message (Message): The command message
+        """
+        self._calibrated_threshold = None
+        self.logger.info("Microphone calibration cleared, will recalibrate on next recording")
+    
+    def _append_recording_audio(self, audio_data: "sr.AudioData"):
+        """
+        Copy a recorded chunk's PCM into the recording buffer at the write cursor.
+        
+        Args:
+            audio_data (sr.AudioData): Audio captured from the microphone
+        """
+        recording = self.current_recording
+        raw = audio_data.get_raw_data()
+        start = recording["bytes_written"]
+        end = start + len(raw)
+        
+        # Grow geometrically so long meetings still need only a few reallocations
+        buffer = recording["audio_buffer"]
+        if end > len(buffer):
+            buffer.extend(bytearray(max(len(buffer), end - len(buffer))))
+        
+        buffer[start:end] = raw
+        recording["bytes_written"] = end
+        recording["chunk_count"] += 1
+        if recording["sample_width"] is None:
+            recording["sample_width"] = audio_data.sample_width
+            recording["sample_rate"] = audio_data.sample_rate
+    
     def _process_recording_chunk(self):
         """Process a chunk of the current recording."""
         # Combine audio chunks into a single audio segment
         # This is a simplified implementation and would need proper buffering in production
         
-        # For this demo, we'll just send a notification that audio chunks are available
+        # For this demo, we'll just send a notification that audio chunks are available.
+        # The range names only the chunks added since the previous notification so
+        # downstream consumers can process the delta.
+        recording = self.current_recording
+        first_chunk = recording["chunks_notified"]
+        last_chunk = recording["chunk_count"] - 1
         message = Message(
             type=MessageType.AUDIO_CAPTURED,
             content={
-                "meeting_id": self.current_recording["meeting_id"],
-                "audio_chunks": len(self.current_recording["audio_chunks"]),
-                "recording_duration": time.time() - self.current_recording["start_time"],
+                "meeting_id": recording["meeting_id"],
+                "audio_chunks": recording["chunk_count"],
+                "chunk_range": (first_chunk, last_chunk),
+                "recording_duration": time.time() - recording["start_time"],
                 "live_recording": True
             }
         )
+        recording["chunks_notified"] = recording["chunk_count"]
         self.send_message(message)
     
     def stop_recording(self, message: Message):
@@ -191,31 +648,25 @@ class TranscriberAgent(BaseAgent):
         # Stop the recording
         self.is_recording = False
         
-        # Combine all audio chunks and save to a file
-        if self.current_recording and self.current_recording["audio_chunks"]:
+        # Save the recorded audio to a file
+        recording = self.current_recording
+        if recording and recording["bytes_written"]:
             try:
                 # Create a temporary file to save the combined audio
                 temp_file = tempfile.NamedTemporaryFile(
                     suffix=".wav", delete=False
                 )
-                self.current_recording["audio_file"] = temp_file.name
-                
-                # Get raw audio data from all chunks
-                combined_audio = AudioSegment.empty()
-                for chunk in self.current_recording["audio_chunks"]:
-                    chunk_audio = AudioSegment(
-                        data=chunk.get_raw_data(),
-                        sample_width=chunk.sample_width,
-                        frame_rate=chunk.sample_rate,
-                        channels=1
-                    )
-                    combined_audio += chunk_audio
+                recording["audio_file"] = temp_file.name
                 
-                # Export to WAV file
-                combined_audio.export(temp_file.name, format="wav")
+                # Write the recorded PCM straight into a WAV container, no ffmpeg involved
+                with temp_file, wave.open(temp_file, "wb") as wav_file:
+                    wav_file.setnchannels(1)
+                    wav_file.setsampwidth(recording["sample_width"])
+                    wav_file.setframerate(recording["sample_rate"])
+                    wav_file.writeframes(memoryview(recording["audio_buffer"])[:recording["bytes_written"]])
                 
                 # Process the complete recording
-                self.process_audio_file(temp_file.name, self.current_recording["meeting_id"])
+                self.process_audio_file(temp_file.name, recording["meeting_id"])
                 
                 self.logger.info(f"Recording saved to {temp_file.name}")
                 
@@ -258,13 +709,38 @@ class TranscriberAgent(BaseAgent):
             # Pre-process the audio file
             processed_audio = self.audio_processor.preprocess_audio(audio_path)
             
+            # Decode once; diarization and transcription share the same samples
+            audio = self._load_audio(processed_audio)
+            
+            # Find the speech regions; both diarization and chunked transcription use them
+            speech_intervals = self._detect_speech(audio)
+            
+            # Nothing worth transcribing; don't spend an API round-trip on silence
+            total_voiced = float(np.sum(speech_intervals[:, 1] - speech_intervals[:, 0]))
+            if total_voiced < self.min_voiced_seconds:
+                self.logger.debug(
+                    f"Only {total_voiced:.2f}s of speech detected for meeting {meeting_id}, "
+                    f"skipping transcription"
+                )
+                self._send_transcription_message(MeetingTranscript(
+                    meeting_id=meeting_id,
+                    transcript_segments=[],
+                    start_time=time.time(),
+                    end_time=time.time(),
+                    audio_path=audio_path
+                ))
+                return
+            
             # Perform speaker diarization if enabled
-            speaker_segments = []
+            speaker_segments = None
             if self.speaker_diarization:
-                speaker_segments = self._perform_speaker_diarization(processed_audio)
+                speaker_segments = self._perform_speaker_diarization(audio, speech_intervals)
             
             # Transcribe the audio
-            transcript = self._transcribe_audio(processed_audio, speaker_segments)
+            whisper_segments = self._transcribe_audio(audio, speech_intervals)
+            
+            # Attach speakers to the transcribed segments
+            transcript = self._assign_speakers(whisper_segments, speaker_segments)
             
             # Create a meeting transcript object
             meeting_transcript = MeetingTranscript(
@@ -294,15 +770,76 @@ class TranscriberAgent(BaseAgent):
             )
             self.send_message(error_message)
     
-    def _perform_speaker_diarization(self, audio_path: str) -> List[Dict[str, Any]]:
+    def _load_audio(self, audio_path: str) -> np.ndarray:
         """
-        Perform speaker diarization on an audio file.
+        Decode an audio file to mono 16-bit PCM samples at the configured sample rate.
+        
+        Samples are kept as int16 rather than float32, which halves the memory
+        held for long meetings; silence detection and WAV encoding both work on
+        int16 directly.
         
         Args:
             audio_path (str): Path to the audio file
             
         Returns:
-            List[Dict[str, Any]]: List of speaker segments with timestamps
+            np.ndarray: Mono int16 samples
+        """
+        try:
+            audio, native_rate = sf.read(audio_path, dtype="int16", always_2d=False)
+        except RuntimeError:
+            # Format not supported by libsndfile (e.g. some compressed formats)
+            import librosa
+            
+            audio, _ = librosa.load(audio_path, sr=self.sample_rate, mono=True)
+            return (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+        
+        if audio.ndim == 2:
+            # Average in float32, not NumPy's default float64, and round back to int16
+            audio = np.rint(audio.mean(axis=1, dtype=np.float32)).astype(np.int16)
+        
+        if native_rate != self.sample_rate:
+            # Only needed for files not already at the target rate
+            from scipy.signal import resample_poly
+            
+            resampled = resample_poly(audio, self.sample_rate, native_rate)
+            audio = np.clip(resampled, -32768, 32767).astype(np.int16)
+        
+        return audio
+    
+    def _detect_speech(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Find the non-silent regions of decoded audio.
+        
+        Args:
+            audio (np.ndarray): Mono samples at the configured sample rate
+            
+        Returns:
+            np.ndarray: (n, 2) array of [start, end) times in seconds
+        """
+        non_silent_segments = _split_non_silent(
+            audio, 
+            top_db=20,
+            frame_length=self.chunk_size,
+            hop_length=self.chunk_size // 4
+        )
+        return non_silent_segments / float(self.sample_rate)
+    
+    def _perform_speaker_diarization(
+        self,
+        audio: np.ndarray,
+        speech_intervals: np.ndarray
+    ) -> Optional[SimpleNamespace]:
+        """
+        Perform speaker diarization on decoded audio.
+        
+        Args:
+            audio (np.ndarray): Mono samples at the configured sample rate
+            speech_intervals (np.ndarray): Non-silent regions from _detect_speech, in seconds
+            
+        Returns:
+            Optional[SimpleNamespace]: Speaker turns as parallel arrays: starts and
+                ends in seconds, and speaker_idx indexing self._speaker_labels.
+                None if diarization failed.
         """
         self.logger.info("Performing speaker diarization")
         
@@ -313,102 +850,231 @@ class TranscriberAgent(BaseAgent):
         # which can sometimes identify speakers in its transcription
         
         try:
-            # Load audio using librosa
-            audio, _ = librosa.load(audio_path, sr=self.sample_rate, mono=True)
-            
-            # Detect non-silent segments
-            non_silent_segments = librosa.effects.split(
-                audio, 
-                top_db=20,
-                frame_length=self.chunk_size,
-                hop_length=self.chunk_size // 4
+            # Treat each non-silent region as one speaker turn, and assign
+            # speakers in a round-robin fashion for demo purposes.
+            # In a real implementation, use a proper speaker diarization algorithm
+            turn_count = len(speech_intervals)
+            return SimpleNamespace(
+                starts=np.ascontiguousarray(speech_intervals[:, 0], dtype=np.float64),
+                ends=np.ascontiguousarray(speech_intervals[:, 1], dtype=np.float64),
+                speaker_idx=(np.arange(turn_count) & 3).astype(np.int8)
             )
             
-            # Convert to seconds
-            segments = []
-            for i, (start, end) in enumerate(non_silent_segments):
-                # Assign speakers in a round-robin fashion for demo purposes
-                # In a real implementation, use a proper speaker diarization algorithm
-                speaker = f"Speaker {(i % 4) + 1}"
-                
-                segments.append({
-                    "start": float(start) / self.sample_rate,
-                    "end": float(end) / self.sample_rate,
-                    "speaker": speaker
-                })
-            
-            return segments
-            
         except Exception as e:
             self.logger.error(f"Error in speaker diarization: {e}")
-            return []
+            return None
     
     def _transcribe_audio(
         self, 
-        audio_path: str, 
-        speaker_segments: List[Dict[str, Any]]
-    ) -> List[TranscriptSegment]:
+        audio: np.ndarray, 
+        speech_intervals: np.ndarray
+    ) -> List[Dict[str, Any]]:
         """
-        Transcribe audio file with speaker identification.
+        Transcribe decoded audio with Whisper.
         
         Args:
-            audio_path (str): Path to the audio file
-            speaker_segments (List[Dict[str, Any]]): Speaker segments from diarization
+            audio (np.ndarray): Mono samples at the configured sample rate
+            speech_intervals (np.ndarray): Non-silent regions from _detect_speech, in seconds
             
         Returns:
-            List[TranscriptSegment]: List of transcript segments with speakers
+            List[Dict[str, Any]]: Whisper segments in time order, or an empty list on failure
         """
         self.logger.info("Transcribing audio")
         
+        try:
+            # Use OpenAI's Whisper model for transcription, split into
+            # chunks at silences so the requests can run concurrently
+            return self._transcribe_chunks_parallel(
+                audio,
+                speech_intervals,
+                max_concurrent=self.max_concurrent_transcriptions
+            )
+        except Exception as e:
+            self.logger.error(f"Error in transcription: {e}")
+            return []
+    
+    def _assign_speakers(
+        self,
+        segments: List[Dict[str, Any]],
+        speaker_segments: Optional[SimpleNamespace]
+    ) -> List[TranscriptSegment]:
+        """
+        Attach a speaker from diarization to each Whisper segment.
+        
+        Args:
+            segments (List[Dict[str, Any]]): Whisper segments
+            speaker_segments (Optional[SimpleNamespace]): Speaker turns from
+                _perform_speaker_diarization, or None if there are none
+            
+        Returns:
+            List[TranscriptSegment]: List of transcript segments with speakers
+        """
         transcript_segments = []
         
         try:
-            # Use OpenAI's Whisper model for transcription
-            with open(audio_path, "rb") as audio_file:
-                response = self.openai_client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    response_format="verbose_json",
-                    timestamp_granularities=["segment"]
-                )
+            # Speaker segments are time-ordered and non-overlapping, so the only
+            # candidate for a transcript segment is the last one starting at or
+            # before it. Look it up with a binary search instead of a scan.
+            has_speakers = speaker_segments is not None and len(speaker_segments.starts) > 0
+            
+            # Pull each field out into its own column once
+            starts = [segment.get('start', 0) for segment in segments]
+            ends = [segment.get('end', 0) for segment in segments]
+            texts = [segment.get('text', '') for segment in segments]
+            confidences = [segment.get('confidence', 0.0) for segment in segments]
             
-            # Process the response
-            if hasattr(response, 'segments'):
-                segments = response.segments
-            else:
-                # Fallback for older API versions or different response formats
-                segments = json.loads(response).get('segments', [])
+            # Find the speaker for every segment in one vectorised search
+            speakers = ["Unknown Speaker"] * len(segments)
+            if has_speakers and segments:
+                speaker_labels = self._speaker_labels
+                idx = np.searchsorted(speaker_segments.starts, starts, side="right") - 1
+                matched = (idx >= 0) & (np.asarray(ends) <= speaker_segments.ends[np.maximum(idx, 0)])
+                matched_segments = np.flatnonzero(matched)
+                matched_labels = speaker_segments.speaker_idx[idx[matched_segments]]
+                for i, label in zip(matched_segments.tolist(), matched_labels.tolist()):
+                    speakers[i] = speaker_labels[label]
             
             # Match transcription segments with speaker segments
-            for i, segment in enumerate(segments):
-                start_time = segment.get('start', 0)
-                end_time = segment.get('end', 0)
-                text = segment.get('text', '')
-                
-                # Find the speaker for this segment
-                speaker = "Unknown Speaker"
-                for speaker_segment in speaker_segments:
-                    if (start_time >= speaker_segment["start"] and 
-                        end_time <= speaker_segment["end"]):
-                        speaker = speaker_segment["speaker"]
-                        break
-                
-                # Create transcript segment
-                transcript_segment = TranscriptSegment(
+            for start_time, end_time, speaker, text, confidence in zip(
+                starts, ends, speakers, texts, confidences
+            ):
+                transcript_segments.append(TranscriptSegment(
                     start_time=start_time,
                     end_time=end_time,
                     speaker=speaker,
                     text=text,
-                    confidence=segment.get('confidence', 0.0)
-                )
-                
-                transcript_segments.append(transcript_segment)
+                    confidence=confidence
+                ))
         
         except Exception as e:
-            self.logger.error(f"Error in transcription: {e}")
+            self.logger.error(f"Error matching speakers to transcript: {e}")
         
         return transcript_segments
     
+    def _transcribe_chunks_parallel(
+        self,
+        audio: np.ndarray,
+        speech_intervals: np.ndarray,
+        max_concurrent: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Transcribe decoded audio as several chunks with bounded concurrency.
+        
+        Chunks are cut in the silences between speech regions so that no
+        utterance is split across two requests. Segment timestamps returned for
+        each chunk are shifted by the chunk's offset before merging.
+        
+        Args:
+            audio (np.ndarray): Mono samples at the configured sample rate
+            speech_intervals (np.ndarray): Non-silent regions from _detect_speech, in seconds
+            max_concurrent (int): Maximum number of requests in flight at once
+            
+        Returns:
+            List[Dict[str, Any]]: Whisper segments in time order, relative to the whole audio
+        """
+        sample_rate = self.sample_rate
+        duration = len(audio) / sample_rate
+        chunks = _plan_transcription_chunks(
+            speech_intervals, duration, self.transcription_chunk_seconds
+        )
+        
+        # Nothing to split, send the audio as-is
+        if len(chunks) <= 1:
+            return self._request_transcription(self._encode_wav(audio))
+        
+        self.logger.info(f"Transcribing {len(chunks)} chunks with up to {max_concurrent} in parallel")
+        
+        chunk_files = [
+            self._encode_wav(audio[int(start * sample_rate):int(end * sample_rate)])
+            for start, end in chunks
+        ]
+        # Run the requests on the agent's own loop and its thread pool instead of
+        # starting a new loop per file. This is never called on the loop thread,
+        # so blocking on the result can't deadlock.
+        results = self._submit(self._gather_transcriptions(chunk_files, max_concurrent)).result()
+        
+        # Shift each chunk's timestamps back onto the timeline of the whole file
+        segments = []
+        for (offset, _), chunk_segments in zip(chunks, results):
+            for segment in chunk_segments:
+                segment["start"] = segment.get("start", 0) + offset
+                segment["end"] = segment.get("end", 0) + offset
+                segments.append(segment)
+        
+        return segments
+    
+    async def _gather_transcriptions(
+        self,
+        chunk_files: List[io.BytesIO],
+        max_concurrent: int
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run transcription requests for several files, at most max_concurrent at a time.
+        
+        Args:
+            chunk_files (List[io.BytesIO]): In-memory WAV files of the audio chunks
+            max_concurrent (int): Maximum number of requests in flight at once
+            
+        Returns:
+            List[List[Dict[str, Any]]]: Whisper segments for each chunk, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        loop = asyncio.get_running_loop()
+        
+        async def transcribe_one(chunk_file: io.BytesIO) -> List[Dict[str, Any]]:
+            async with semaphore:
+                # The OpenAI client is blocking, so run it on the default thread pool
+                return await loop.run_in_executor(None, self._request_transcription, chunk_file)
+        
+        return await asyncio.gather(*(transcribe_one(f) for f in chunk_files))
+    
+    def _encode_wav(self, audio: np.ndarray) -> io.BytesIO:
+        """
+        Wrap samples in an in-memory 16-bit PCM WAV file for upload.
+        
+        The samples are already 16-bit PCM, so no encoder is involved: the file
+        is a generated header followed by the raw bytes. Chunks passed in as
+        slices of the decoded audio are views of one shared buffer, so each
+        chunk costs a single copy into its BytesIO.
+        
+        Args:
+            audio (np.ndarray): Mono int16 samples at the configured sample rate
+            
+        Returns:
+            io.BytesIO: WAV file positioned at the start, named so the API can infer the format
+        """
+        pcm = np.ascontiguousarray(audio, dtype="<i2")
+        buffer = io.BytesIO(_make_wav_header(len(pcm), self.sample_rate) + memoryview(pcm).cast("B"))
+        buffer.name = "audio.wav"
+        return buffer
+    
+    def _request_transcription(self, audio_file: io.BytesIO) -> List[Dict[str, Any]]:
+        """
+        Send a single audio file to Whisper.
+        
+        Args:
+            audio_file (io.BytesIO): In-memory WAV file
+            
+        Returns:
+            List[Dict[str, Any]]: Whisper segments with timestamps relative to the file
+        """
+        response = self.openai_client.audio.transcriptions.create(
+            model="whisper-1",
+            file=audio_file,
+            response_format="verbose_json",
+            timestamp_granularities=["segment"]
+        )
+        
+        # Process the response
+        if hasattr(response, 'segments'):
+            segments = response.segments
+        else:
+            # Fallback for older API versions or different response formats
+            segments = _json.loads(response).get('segments', [])
+        
+        # Segments may be SDK model objects; copy to plain dicts so timestamps can be adjusted
+        return [dict(segment) for segment in segments]
+    
     def _send_transcription_message(self, transcript: MeetingTranscript):
         """
         Send the transcription to other agents.